@@ -9,24 +9,292 @@ Usage:
     python3 json_rpc_server.py [--framework-path PATH]
 """
 
+from __future__ import annotations
+
+import asyncio
 import sys
 import json
-import argparse
 import time
-from typing import Dict, Any, Optional
+
+# orjson parses/serializes JSON in native code and is ~2-10x faster than the
+# stdlib on this per-line hot path; fall back to stdlib when unavailable.
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps  # returns bytes
+    _JSON_DECODE_ERRORS = (orjson.JSONDecodeError, json.JSONDecodeError)
+
+    def _dumps_line(obj):
+        """Serialize a full output line, newline included, in one allocation"""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    orjson = None
+
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    def _dumps_line(obj):
+        return json.dumps(obj).encode() + b'\n'
+
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+
+# Shared empty-dict sentinel for error responses without data. Serialized,
+# never mutated, so one instance can back every such response.
+_EMPTY: dict = {}
+
+# Canonical envelope prefix emitted by well-behaved framers; lines starting
+# with it can skip the Python-level version validation entirely
+_RPC_PREFIX = b'{"jsonrpc":"2.0"'
+
+# Pre-built envelope fragments for responses whose result bytes are cached.
+# Only the id and responseTime vary, so the rest is spliced from constants.
+_ENV_PREFIX = b'{"jsonrpc":"2.0","id":'
+_ENV_RESULT = b',"result":{"data":'
+_ENV_METADATA = b',"metadata":{"executionTime":50,"cached":false,"version":"1.0.0","responseTime":'
+_ENV_SUFFIX = b'}}}\n'
+
+
+def _scan_value(buf: bytes, i: int) -> int:
+    """Return the index one past the JSON value starting at buf[i]"""
+    c = buf[i]
+    if c == 0x22:  # '"' string
+        i += 1
+        while True:
+            c = buf[i]
+            if c == 0x5C:  # backslash escape
+                i += 2
+            elif c == 0x22:
+                return i + 1
+            else:
+                i += 1
+    if c in (0x7B, 0x5B):  # '{' or '[' container
+        depth = 0
+        in_str = False
+        while True:
+            c = buf[i]
+            if in_str:
+                if c == 0x5C:
+                    i += 1
+                elif c == 0x22:
+                    in_str = False
+            elif c == 0x22:
+                in_str = True
+            elif c in (0x7B, 0x5B):
+                depth += 1
+            elif c in (0x7D, 0x5D):
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+    # number / true / false / null
+    end = len(buf)
+    while i < end and buf[i] not in b',}] \t\r\n':
+        i += 1
+    return i
+
+
+def _slice_value(buf: bytes, key: bytes) -> bytes | None:
+    """Slice the raw bytes of the JSON value following key, or None"""
+    try:
+        start = buf.index(key) + len(key)
+        while buf[start] in b' \t':
+            start += 1
+        return buf[start:_scan_value(buf, start)]
+    except (ValueError, IndexError):
+        return None
+
+
+# Specialized source for the parameterized mock handlers, compiled once at
+# startup via exec. Each body is a straight-line literal-dict constructor
+# (a single BUILD_MAP over pre-interned keys) behind a per-key memo held in
+# a default-arg dict; results are shared and treated as read-only by the
+# serializer. Only the genuinely dynamic parameters keep a params.get.
+_SPECIALIZED_HANDLERS_SRC = '''
+def get_recommendations(params, _cache={}):
+    domain = params.get('domain', 'general')
+    cached = _cache.get(domain)
+    if cached is not None:
+        return cached
+    result = _cache[domain] = {
+        'recommendations': [
+            {
+                'pattern_name': domain + '_pattern_1',
+                'confidence_score': 0.95,
+                'domain': domain,
+                'success_rate': 0.92,
+                'avg_performance_ms': 150,
+                'usage_count': 42,
+                'description': 'High-performance ' + domain + ' pattern',
+                'anti_patterns': []
+            },
+            {
+                'pattern_name': domain + '_pattern_2',
+                'confidence_score': 0.87,
+                'domain': domain,
+                'success_rate': 0.85,
+                'avg_performance_ms': 200,
+                'usage_count': 28,
+                'description': 'Robust ' + domain + ' pattern',
+                'anti_patterns': ['avoid_blocking_io']
+            }
+        ],
+        'total_patterns': 2,
+        'execution_time_ms': 15
+    }
+    return result
+
+
+def find_similar(params, _cache={}):
+    description = params.get('description', '')
+    cached = _cache.get(description)
+    if cached is not None:
+        return cached
+    result = _cache[description] = {
+        'similar_patterns': [
+            {
+                'pattern_name': 'similar_pattern_1',
+                'similarity_score': 0.89,
+                'description': 'Pattern similar to: ' + description
+            }
+        ]
+    }
+    return result
+
+
+def generate_extension(params, _cache={}):
+    description = params.get('description', '')
+    backend = params.get('backend_language', 'python')
+    key = (description, backend)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+    result = _cache[key] = {
+        'success': True,
+        'extension_path': '/mock/path/extension_' + backend,
+        'backend': backend,
+        'generated_files': [
+            'extension_' + backend + '.py',
+            'tests.py',
+            'README.md'
+        ],
+        'test_suite': 'tests_' + backend + '.py',
+        'performance': {
+            'estimated_ops_per_sec': 10000 if backend == 'python' else 100000,
+            'memory_usage': 1024
+        }
+    }
+    return result
+'''
 
 
 class JSONRPCServer:
     """Mock JSON-RPC 2.0 server"""
 
+    # Fixed-offset attribute access instead of per-instance __dict__ lookups
+    __slots__ = (
+        'framework_path',
+        'request_count',
+        '_dispatch',
+        '_static_results',
+        '_err_data_cache',
+        '_succ_tmpl',
+        '_err_tmpl',
+    )
+
     def __init__(self, framework_path: str):
         self.framework_path = framework_path
         self.request_count = 0
 
-    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle a JSON-RPC request"""
+        # Compile the specialized parameterized handlers once; their
+        # straight-line bodies skip all the dict-default branching a
+        # generic handler would re-execute per call
+        ns = {}
+        exec(_SPECIALIZED_HANDLERS_SRC, ns)
+
+        # Method name -> handler. A single hashed lookup replaces the
+        # chain of string compares a per-method if/elif ladder would cost.
+        self._dispatch = {
+            'pattern_learning.get_recommendations': ns['get_recommendations'],
+            'pattern_learning.find_similar': ns['find_similar'],
+            'pattern_learning.get_statistics': self._mock_get_statistics,
+            'extension_generator.analyze_requirements': self._mock_analyze_requirements,
+            'extension_generator.generate': ns['generate_extension'],
+            'agent.detect_type': self._mock_detect_agent_type,
+            'test.echo': self._mock_echo,
+            'test.sleep': self._mock_sleep,
+            'test.error': self._mock_error,
+        }
+
+        # Reusable response envelopes: each builder mutates its template in
+        # place and serializes it immediately, saving ~5 dict allocations
+        # per response
+        self._succ_tmpl = {
+            'jsonrpc': '2.0',
+            'id': None,
+            'result': {
+                'data': None,
+                'metadata': {
+                    'executionTime': 50,
+                    'cached': False,
+                    'version': '1.0.0',
+                    'responseTime': 0
+                }
+            }
+        }
+        self._err_tmpl = {
+            'jsonrpc': '2.0',
+            'id': None,
+            'error': {
+                'code': 0,
+                'message': '',
+                'data': {}
+            }
+        }
+
+        # Error data dicts keyed by exception type; the hot-on-errors path
+        # becomes a dict lookup instead of f-string formatting per raise
+        self._err_data_cache = {}
+
+        # Results that are identical on every call, serialized once so the
+        # hit path skips dict construction and JSON serialization entirely.
+        self._static_results = {
+            'pattern_learning.get_statistics': _dumps(self._mock_get_statistics({})),
+            'agent.detect_type': _dumps(self._mock_detect_agent_type({})),
+        }
+
+    async def handle_request(self, request: object) -> bytes:
+        """Handle a JSON-RPC request or batch of requests
+
+        Returns the serialized, newline-terminated response bytes, ready to
+        write in a single call.
+        """
+        # One integer clock read per request; time_ns avoids the float
+        # multiply/truncate round trip of time.time() * 1000
+        now_ms = time.time_ns() // 1_000_000
+
+        # Batch: handle every sub-request in one tight loop and emit the
+        # whole array as a single write, amortizing per-call overhead
+        if isinstance(request, list):
+            # Sub-responses carry their line terminator; trim it when
+            # joining them into the array payload
+            parts = [await self._handle_one(r, now_ms) for r in request]
+            return b'[' + b','.join(p[:-1] for p in parts) + b']\n'
+
+        return await self._handle_one(request, now_ms)
+
+    async def _handle_one(self, request: dict, now_ms: int) -> bytes:
+        """Handle a single JSON-RPC request, validating the envelope"""
+        if not isinstance(request, dict):
+            return self._error_response(
+                None,
+                -32600,
+                'Invalid Request: expected an object'
+            )
 
-        # Validate JSON-RPC 2.0 format
         if request.get('jsonrpc') != '2.0':
             return self._error_response(
                 request.get('id'),
@@ -34,8 +302,14 @@ class JSONRPCServer:
                 'Invalid Request: jsonrpc must be "2.0"'
             )
 
+        return await self._handle_fast(request, now_ms)
+
+    async def _handle_fast(self, request: dict, now_ms: int) -> bytes:
+        """Handle a request whose envelope is already known to be valid"""
+        # Destructure once: each key costs exactly one hashed lookup, and
+        # request_id is threaded to every response builder from here on
         method = request.get('method')
-        params = request.get('params', {})
+        params = request.get('params') or {}
         request_id = request.get('id')
 
         if not method:
@@ -45,110 +319,68 @@ class JSONRPCServer:
                 'Invalid Request: method required'
             )
 
+        # Static fast path: splice the pre-serialized result into the
+        # envelope without building or serializing any dicts
+        static = self._static_results.get(method)
+        if static is not None and not params:
+            self.request_count += 1
+            return self._static_response(request_id, static, now_ms)
+
         # Route to method handler
         try:
-            result = self._route_method(method, params)
-            return self._success_response(request_id, result)
+            result = await self._route_method(method, params)
+            return self._success_response(request_id, result, now_ms)
 
         except Exception as e:
-            return self._error_response(
-                request_id,
-                -32603,
-                f'Internal error: {str(e)}',
-                {
-                    'pythonType': type(e).__name__,
-                    'traceback': f'Mock traceback for {type(e).__name__}'
+            tcls = type(e)
+            error_data = self._err_data_cache.get(tcls)
+            if error_data is None:
+                name = tcls.__name__
+                error_data = {
+                    'pythonType': name,
+                    'traceback': f'Mock traceback for {name}'
                 }
-            )
-
-    def _route_method(self, method: str, params: Dict[str, Any]) -> Any:
-        """Route method to appropriate handler"""
-
-        self.request_count += 1
+                self._err_data_cache[tcls] = error_data
 
-        # Pattern learning methods
-        if method == 'pattern_learning.get_recommendations':
-            return self._mock_get_recommendations(params)
+            # Skip the str(e) fallback for the common single-string case
+            args = e.args
+            if len(args) == 1 and isinstance(args[0], str):
+                message = 'Internal error: ' + args[0]
+            else:
+                message = f'Internal error: {e}'
 
-        elif method == 'pattern_learning.find_similar':
-            return self._mock_find_similar(params)
+            return self._error_response(request_id, -32603, message, error_data)
 
-        elif method == 'pattern_learning.get_statistics':
-            return self._mock_get_statistics(params)
-
-        # Extension generation methods
-        elif method == 'extension_generator.analyze_requirements':
-            return self._mock_analyze_requirements(params)
-
-        elif method == 'extension_generator.generate':
-            return self._mock_generate_extension(params)
-
-        # Agent methods
-        elif method == 'agent.detect_type':
-            return self._mock_detect_agent_type(params)
-
-        # Test methods
-        elif method == 'test.echo':
-            return params
-
-        elif method == 'test.sleep':
-            duration = params.get('duration', 1)
-            time.sleep(duration)
-            return {'slept': duration}
-
-        elif method == 'test.error':
-            error_type = params.get('type', 'ValueError')
-            raise ValueError(f'Mock {error_type}')
-
-        else:
+    async def _route_method(self, method: str, params: dict) -> object:
+        """Route method to appropriate handler"""
+        handler = self._dispatch.get(method)
+        if handler is None:
             raise ValueError(f'Method not found: {method}')
 
+        self.request_count += 1
+        result = handler(params)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
     # Mock method implementations
 
-    def _mock_get_recommendations(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Mock pattern recommendations"""
-        domain = params.get('domain', 'general')
-        return {
-            'recommendations': [
-                {
-                    'pattern_name': f'{domain}_pattern_1',
-                    'confidence_score': 0.95,
-                    'domain': domain,
-                    'success_rate': 0.92,
-                    'avg_performance_ms': 150,
-                    'usage_count': 42,
-                    'description': f'High-performance {domain} pattern',
-                    'anti_patterns': []
-                },
-                {
-                    'pattern_name': f'{domain}_pattern_2',
-                    'confidence_score': 0.87,
-                    'domain': domain,
-                    'success_rate': 0.85,
-                    'avg_performance_ms': 200,
-                    'usage_count': 28,
-                    'description': f'Robust {domain} pattern',
-                    'anti_patterns': ['avoid_blocking_io']
-                }
-            ],
-            'total_patterns': 2,
-            'execution_time_ms': 15
-        }
+    def _mock_echo(self, params: dict) -> dict:
+        """Echo params back unchanged"""
+        return params
 
-    def _mock_find_similar(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Mock similar pattern search"""
-        description = params.get('description', '')
-        return {
-            'similar_patterns': [
-                {
-                    'pattern_name': 'similar_pattern_1',
-                    'similarity_score': 0.89,
-                    'description': f'Pattern similar to: {description}'
-                }
-            ]
-        }
+    async def _mock_sleep(self, params: dict) -> dict:
+        """Sleep for the requested duration without blocking other requests"""
+        duration = params.get('duration', 1)
+        await asyncio.sleep(duration)
+        return {'slept': duration}
+
+    def _mock_error(self, params: dict) -> dict:
+        """Raise a mock error"""
+        error_type = params.get('type', 'ValueError')
+        raise ValueError(f'Mock {error_type}')
 
-    def _mock_get_statistics(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _mock_get_statistics(self, params: dict) -> dict:
         """Mock pattern statistics"""
         return {
             'total_patterns': 156,
@@ -163,7 +395,7 @@ class JSONRPCServer:
             'total_usage': 1243
         }
 
-    def _mock_analyze_requirements(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _mock_analyze_requirements(self, params: dict) -> dict:
         """Mock requirements analysis"""
         description = params.get('description', '')
         return {
@@ -177,28 +409,7 @@ class JSONRPCServer:
             'confidence': 0.88
         }
 
-    def _mock_generate_extension(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Mock extension generation"""
-        description = params.get('description', '')
-        backend = params.get('backend_language', 'python')
-
-        return {
-            'success': True,
-            'extension_path': f'/mock/path/extension_{backend}',
-            'backend': backend,
-            'generated_files': [
-                f'extension_{backend}.py',
-                'tests.py',
-                'README.md'
-            ],
-            'test_suite': f'tests_{backend}.py',
-            'performance': {
-                'estimated_ops_per_sec': 10000 if backend == 'python' else 100000,
-                'memory_usage': 1024
-            }
-        }
-
-    def _mock_detect_agent_type(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _mock_detect_agent_type(self, params: dict) -> dict:
         """Mock agent type detection"""
         return {
             'agent_type': 'claude_code',
@@ -207,84 +418,199 @@ class JSONRPCServer:
             'tier': 'development'
         }
 
-    def _success_response(self, request_id: str, result: Any) -> Dict[str, Any]:
-        """Create success response"""
-        return {
-            'jsonrpc': '2.0',
-            'id': request_id,
-            'result': {
-                'data': result,
-                'metadata': {
-                    'executionTime': 50,
-                    'cached': False,
-                    'version': '1.0.0',
-                    'responseTime': int(time.time() * 1000)
-                }
-            }
-        }
+    def _static_response(self, request_id: object, body: bytes, now_ms: int) -> bytes:
+        """Assemble a response around a pre-serialized result body"""
+        return b''.join((
+            _ENV_PREFIX, _dumps(request_id),
+            _ENV_RESULT, body,
+            _ENV_METADATA, str(now_ms).encode(),
+            _ENV_SUFFIX,
+        ))
+
+    def _success_response(self, request_id: str, result: object, now_ms: int) -> bytes:
+        """Serialize a success response from the shared envelope template
+
+        The template is mutated and serialized in one step with no await in
+        between, so concurrent handler tasks never observe each other's
+        fields.
+        """
+        tmpl = self._succ_tmpl
+        tmpl['id'] = request_id
+        res = tmpl['result']
+        res['data'] = result
+        res['metadata']['responseTime'] = now_ms
+        return _dumps_line(tmpl)
 
     def _error_response(
         self,
-        request_id: Optional[str],
+        request_id: str | None,
         code: int,
         message: str,
-        data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Create error response"""
-        return {
-            'jsonrpc': '2.0',
-            'id': request_id,
-            'error': {
-                'code': code,
-                'message': message,
-                'data': data or {}
-            }
-        }
+        data: dict | None = None
+    ) -> bytes:
+        """Serialize an error response from the shared envelope template"""
+        tmpl = self._err_tmpl
+        tmpl['id'] = request_id
+        err = tmpl['error']
+        err['code'] = code
+        err['message'] = message
+        err['data'] = data if data is not None else _EMPTY
+        return _dumps_line(tmpl)
+
+    def _fast_echo(self, raw: bytes) -> bytes | None:
+        """Echo fast path: re-emit the request's raw params bytes
+
+        Parses the line once — confirming it is valid JSON and really a
+        test.echo request — but slices the params value straight out of the
+        input bytes and splices it into the pre-built envelope, so the
+        payload skips routing, response dict construction, and
+        re-serialization. Returns None whenever the line doesn't match the
+        expected shape, so the caller falls back to the full handling path.
+        """
+        # More than one "params" occurrence makes the slice ambiguous
+        # (e.g. a params payload containing its own "params" key)
+        if raw.count(b'"params"') > 1:
+            return None
+
+        params_bytes = _slice_value(raw, b'"params":')
 
-    def run(self):
-        """Run the server (stdio mode)"""
-        # Send ready signal
-        print('READY', flush=True)
+        try:
+            request = _loads(raw)
+        except _JSON_DECODE_ERRORS:
+            # Let the full path report the parse error
+            return None
+        if not isinstance(request, dict) or request.get('method') != 'test.echo':
+            return None
+
+        if 'params' in request:
+            if params_bytes is None:
+                # params present but not sliceable (e.g. whitespace around
+                # the colon): fall back to the re-parse/re-dump path
+                return None
+            if params_bytes == b'null':
+                params_bytes = b'{}'
+        else:
+            params_bytes = b'{}'
 
-        # Process requests from stdin
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
+        self.request_count += 1
+        return b''.join((
+            _ENV_PREFIX, _dumps(request.get('id')),
+            _ENV_RESULT, params_bytes,
+            _ENV_METADATA, str(time.time_ns() // 1_000_000).encode(),
+            _ENV_SUFFIX,
+        ))
+
+    async def _handle_line(self, raw: bytes) -> bytes:
+        """Parse one input line and produce its response bytes"""
+        try:
+            # The echo fast path only applies to single canonical 2.0
+            # frames; batches and non-2.0 envelopes must not match
+            if raw.startswith(_RPC_PREFIX) and b'"method":"test.echo"' in raw:
+                response = self._fast_echo(raw)
+                if response is not None:
+                    return response
+
+            # A line starting with the canonical prefix is a single valid
+            # 2.0 envelope: one C-level startswith replaces the Python-side
+            # validation for ~all well-formed traffic
+            if raw.startswith(_RPC_PREFIX):
+                request = _loads(raw)
+                return await self._handle_fast(
+                    request, time.time_ns() // 1_000_000
+                )
 
-            try:
-                request = json.loads(line)
-                response = self.handle_request(request)
-                print(json.dumps(response), flush=True)
+            request = _loads(raw)
+            return await self.handle_request(request)
 
-            except json.JSONDecodeError as e:
-                error_response = self._error_response(
-                    None,
-                    -32700,
-                    f'Parse error: {str(e)}'
-                )
-                print(json.dumps(error_response), flush=True)
+        except _JSON_DECODE_ERRORS as e:
+            return self._error_response(
+                None,
+                -32700,
+                f'Parse error: {str(e)}'
+            )
 
-            except Exception as e:
-                error_response = self._error_response(
-                    None,
-                    -32603,
-                    f'Internal error: {str(e)}'
-                )
-                print(json.dumps(error_response), flush=True)
+        except Exception as e:
+            return self._error_response(
+                None,
+                -32603,
+                f'Internal error: {str(e)}'
+            )
 
+    async def _write_responses(self, queue: asyncio.Queue):
+        """Drain completed responses to stdout in submission order"""
+        out = sys.stdout.buffer
+        while True:
+            task = await queue.get()
+            if task is None:
+                break
+            # Never hold completed responses hostage behind a slow handler:
+            # push buffered replies out before blocking on an unfinished task
+            if not task.done():
+                out.flush()
+            # Responses arrive newline-terminated: one write per response
+            out.write(await task)
+
+            # Coalesce back-to-back replies: only flush once the queue of
+            # in-flight responses has drained
+            if queue.empty():
+                out.flush()
+        out.flush()
+
+    async def _run_async(self):
+        """Async stdio loop: overlap parsing/handling of in-flight requests"""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        protocol = asyncio.StreamReaderProtocol(reader)
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+
+        out = sys.stdout.buffer
 
-def main():
-    parser = argparse.ArgumentParser(description='JSON-RPC Mock Server')
-    parser.add_argument(
-        '--framework-path',
-        default='/mock/framework/path',
-        help='Framework path (not used in mock)'
-    )
+        # Send ready signal
+        out.write(b'READY\n')
+        out.flush()
+
+        # One task per input line; the writer task emits completions in
+        # submission order so responses stay ordered even when a handler
+        # (e.g. test.sleep) finishes late
+        queue = asyncio.Queue()
+        writer = asyncio.create_task(self._write_responses(queue))
+
+        while True:
+            raw = await reader.readline()
+            if not raw:
+                break
+            # A framer that writes json + '\n' (or '\r\n') only ever needs
+            # the line terminator removed; skip the full whitespace walk of
+            # strip()
+            if raw.endswith(b'\r\n'):
+                raw = raw[:-2]
+            elif raw.endswith(b'\n'):
+                raw = raw[:-1]
+            else:
+                raw = raw.rstrip()
+            if not raw:
+                continue
+            await queue.put(asyncio.create_task(self._handle_line(raw)))
+
+        await queue.put(None)
+        await writer
+
+    def run(self):
+        """Run the server (stdio mode)"""
+        asyncio.run(self._run_async())
 
-    args = parser.parse_args()
 
-    server = JSONRPCServer(args.framework_path)
+def main():
+    # A hand-rolled scan of the single supported flag keeps the argparse
+    # import (and its startup cost) off every test-spawned interpreter
+    framework_path = '/mock/framework/path'
+    argv = sys.argv[1:]
+    if '--framework-path' in argv:
+        idx = argv.index('--framework-path') + 1
+        if idx < len(argv):
+            framework_path = argv[idx]
+
+    server = JSONRPCServer(framework_path)
     server.run()
 
 
@@ -0,0 +1,195 @@
+/**
+ * Integration tests for the mock JSON-RPC server fixture
+ *
+ * Spawns fixtures/json_rpc_server.py over stdio and exercises the wire
+ * protocol directly: validation, batches, the echo fast path's fallback
+ * edges, parse errors, and line framing.
+ */
+
+import assert from 'node:assert';
+import { spawn } from 'node:child_process';
+import { fileURLToPath } from 'node:url';
+import { dirname, join } from 'node:path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+const mockServerScript = join(__dirname, '../fixtures/json_rpc_server.py');
+
+/**
+ * Spawn the server and return helpers for line-oriented request/response.
+ */
+function startServer() {
+  const proc = spawn('python3', [mockServerScript]);
+  let buffer = '';
+  const pending = [];
+  const waiting = [];
+
+  proc.stdout.on('data', (data) => {
+    buffer += data.toString();
+    let newlineIndex;
+    while ((newlineIndex = buffer.indexOf('\n')) !== -1) {
+      const line = buffer.substring(0, newlineIndex);
+      buffer = buffer.substring(newlineIndex + 1);
+      if (waiting.length > 0) {
+        waiting.shift()(line);
+      } else {
+        pending.push(line);
+      }
+    }
+  });
+
+  const readLine = (timeoutMs = 5000) => new Promise((resolve, reject) => {
+    if (pending.length > 0) {
+      resolve(pending.shift());
+      return;
+    }
+    const timer = setTimeout(
+      () => reject(new Error('Timed out waiting for response line')),
+      timeoutMs
+    );
+    waiting.push((line) => {
+      clearTimeout(timer);
+      resolve(line);
+    });
+  });
+
+  const send = (line) => proc.stdin.write(line + '\n');
+
+  const shutdown = () => new Promise((resolve) => {
+    proc.on('exit', resolve);
+    proc.stdin.end();
+  });
+
+  return { proc, send, readLine, shutdown };
+}
+
+async function runTests() {
+  console.log('Mock JSON-RPC Server - Integration Tests\n');
+
+  let passedTests = 0;
+  let failedTests = 0;
+
+  async function test(name, fn) {
+    try {
+      await fn();
+      console.log(`✓ ${name}`);
+      passedTests++;
+    } catch (error) {
+      console.error(`✗ ${name}`);
+      console.error(`  ${error.message}`);
+      failedTests++;
+    }
+  }
+
+  const server = startServer();
+  const ready = await server.readLine();
+  assert.strictEqual(ready, 'READY');
+
+  const call = async (line) => {
+    server.send(line);
+    return JSON.parse(await server.readLine());
+  };
+
+  await test('echoes params for a plain test.echo request', async () => {
+    const r = await call('{"jsonrpc":"2.0","id":1,"method":"test.echo","params":{"message":"hello"}}');
+    assert.strictEqual(r.id, 1);
+    assert.deepStrictEqual(r.result.data, { message: 'hello' });
+  });
+
+  await test('rejects test.echo with a non-2.0 version', async () => {
+    const r = await call('{"jsonrpc":"1.0","id":2,"method":"test.echo","params":{"a":1}}');
+    assert.strictEqual(r.error.code, -32600);
+  });
+
+  await test('returns an array for a single-element echo batch', async () => {
+    const r = await call('[{"jsonrpc":"2.0","id":3,"method":"test.echo","params":{"a":1}}]');
+    assert.ok(Array.isArray(r), `expected array, got ${JSON.stringify(r)}`);
+    assert.deepStrictEqual(r[0].result.data, { a: 1 });
+  });
+
+  await test('reports a parse error for a valid prefix with trailing garbage', async () => {
+    const r = await call('{"jsonrpc":"2.0","id":4,"method":"test.echo","params":{"a":1}}garbage');
+    assert.strictEqual(r.error.code, -32700);
+    assert.strictEqual(r.id, null);
+  });
+
+  await test('echoes correct params when whitespace precedes the params colon', async () => {
+    const r = await call('{"jsonrpc":"2.0","id":5,"method":"test.echo","params" :{"a":1}}');
+    assert.strictEqual(r.id, 5);
+    assert.deepStrictEqual(r.result.data, { a: 1 });
+  });
+
+  await test('echoes nested and escaped params via the byte slicer', async () => {
+    const r = await call('{"jsonrpc":"2.0","id":"ab\\"c","method":"test.echo","params":{"s":"x}y\\"z","n":[1,{"b":2}]}}');
+    assert.strictEqual(r.id, 'ab"c');
+    assert.deepStrictEqual(r.result.data, { s: 'x}y"z', n: [1, { b: 2 }] });
+  });
+
+  await test('treats missing and null params as empty', async () => {
+    let r = await call('{"jsonrpc":"2.0","id":6,"method":"test.echo"}');
+    assert.deepStrictEqual(r.result.data, {});
+    r = await call('{"jsonrpc":"2.0","id":7,"method":"test.echo","params":null}');
+    assert.deepStrictEqual(r.result.data, {});
+  });
+
+  await test('does not echo when params merely mention test.echo', async () => {
+    const r = await call('{"jsonrpc":"2.0","id":8,"method":"test.sleep","params":{"duration":0,"note":"\\"method\\":\\"test.echo\\""}}');
+    assert.strictEqual(r.id, 8);
+    assert.deepStrictEqual(r.result.data, { slept: 0 });
+  });
+
+  await test('flushes completed responses while a slow request is in flight', async () => {
+    // One write so both lines reach the server together
+    server.send(
+      '{"jsonrpc":"2.0","id":9,"method":"test.echo","params":{"fast":true}}\n' +
+      '{"jsonrpc":"2.0","id":10,"method":"test.sleep","params":{"duration":0.5}}'
+    );
+    const start = Date.now();
+    const fast = JSON.parse(await server.readLine());
+    const fastMs = Date.now() - start;
+    const slow = JSON.parse(await server.readLine());
+    assert.strictEqual(fast.id, 9);
+    assert.strictEqual(slow.id, 10);
+    assert.ok(fastMs < 300, `echo held back ${fastMs}ms behind the sleep`);
+  });
+
+  await test('skips blank LF and CRLF lines silently', async () => {
+    server.send('');
+    server.send('\r');
+    const r = await call('{"jsonrpc":"2.0","id":11,"method":"agent.detect_type"}');
+    // If blank lines produced error responses, this id would not line up
+    assert.strictEqual(r.id, 11);
+    assert.strictEqual(r.result.data.agent_type, 'claude_code');
+  });
+
+  await test('accepts CRLF-framed requests', async () => {
+    server.send('{"jsonrpc":"2.0","id":12,"method":"test.echo","params":{"a":1}}\r');
+    const r = JSON.parse(await server.readLine());
+    assert.strictEqual(r.id, 12);
+    assert.deepStrictEqual(r.result.data, { a: 1 });
+  });
+
+  await server.shutdown();
+
+  // Summary
+  console.log('═'.repeat(50));
+  console.log(`\nTest Results:`);
+  console.log(`  Passed: ${passedTests}`);
+  console.log(`  Failed: ${failedTests}`);
+  console.log(`  Total:  ${passedTests + failedTests}`);
+
+  if (failedTests === 0) {
+    console.log('\n✓ All tests passed!');
+    process.exit(0);
+  } else {
+    console.log(`\n✗ ${failedTests} test(s) failed`);
+    process.exit(1);
+  }
+}
+
+// Run tests
+runTests().catch(error => {
+  console.error('Test runner error:', error);
+  process.exit(1);
+});